@@ -0,0 +1,106 @@
+"""
+Thin ctypes wrapper over Linux statx(2) for partial metadata queries
+
+A full stat fills a 144-byte struct the scanner mostly ignores. statx
+lets us ask for just size, timestamps and the file type, and
+AT_STATX_DONT_SYNC tells network filesystems they may answer from cache
+instead of round-tripping to the server. Availability is probed once at
+import; everywhere else falls back to os.stat.
+"""
+import ctypes
+import os
+import sys
+from typing import NamedTuple, Optional
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_CTIME = 0x0080
+_STATX_SIZE = 0x0200
+_MASK = _STATX_TYPE | _STATX_SIZE | _STATX_MTIME | _STATX_CTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('_reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from linux/stat.h
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('stx_mnt_id', ctypes.c_uint64),
+        ('_spare2', ctypes.c_uint64),
+        ('_spare3', ctypes.c_uint64 * 12),
+    ]
+
+
+class StatxResult(NamedTuple):
+    """The subset of stat fields the scanner actually reads"""
+    st_mode: int
+    st_size: int
+    st_mtime: float
+    st_ctime: float
+
+
+_statx = None
+if sys.platform == 'linux':
+    try:
+        _libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        _statx = _libc.statx
+        _statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                           ctypes.c_uint, ctypes.POINTER(_Statx)]
+        _statx.restype = ctypes.c_int
+        # Probe once; old kernels return ENOSYS, old glibc lacks the symbol
+        if _statx(_AT_FDCWD, b'.', _AT_STATX_DONT_SYNC, _MASK,
+                  ctypes.byref(_Statx())) != 0:
+            _statx = None
+    except (OSError, AttributeError):
+        _statx = None
+
+HAS_STATX = _statx is not None
+
+
+def statx(path) -> Optional[StatxResult]:
+    """Partial stat of path; None if the call fails for any reason
+
+    Callers should fall back to os.stat on None so unusual paths and
+    filesystems keep working.
+    """
+    buf = _Statx()
+    try:
+        encoded = os.fsencode(path)
+    except (TypeError, ValueError):
+        return None
+    if _statx(_AT_FDCWD, encoded, _AT_STATX_DONT_SYNC, _MASK,
+              ctypes.byref(buf)) != 0:
+        return None
+    return StatxResult(
+        buf.stx_mode,
+        buf.stx_size,
+        buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9,
+        buf.stx_ctime.tv_sec + buf.stx_ctime.tv_nsec * 1e-9,
+    )
@@ -8,11 +8,53 @@ import threading
 import subprocess
 import os
 import json
+import queue
+import sys
+import time
+import types
 from photopuller_core import PhotoPullerCore
 
+# Treeview status text per copy result; module-level so the hot progress
+# path doesn't rebuild the mapping per file (read-only proxy to be safe).
+# Interned so repeated equality checks are pointer compares.
+_STATUS_TEXT = types.MappingProxyType({
+    'copied': sys.intern('✓ Copied'),
+    'skipped': sys.intern('⊘ Skipped'),
+    'error': sys.intern('✗ Error'),
+    'duplicate': sys.intern('↻ Duplicate'),
+    'would_copy': sys.intern('✓ Would Copy'),  # For dry-run
+})
+_NOT_COPIED = sys.intern('Not Copied')
+_COPYING = sys.intern('Copying...')
+
+# Treeview tag per status text; styling lives in tag_configure so restyling
+# a whole status class is one Tcl call rather than one per row
+_STATUS_TAG = types.MappingProxyType({
+    _STATUS_TEXT['copied']: 'copied',
+    _STATUS_TEXT['skipped']: 'skipped',
+    _STATUS_TEXT['error']: 'error',
+    _STATUS_TEXT['duplicate']: 'duplicate',
+    _STATUS_TEXT['would_copy']: 'would_copy',
+    _COPYING: 'copying',
+    _NOT_COPIED: 'not_copied',
+})
+
+
+def set_if_changed(var, value):
+    """Set a tk Variable only if the value differs, avoiding no-op redraws"""
+    if var.get() != value:
+        var.set(value)
+
 class PhotoPullerGUI:
     """Main GUI application"""
-    
+
+    # Number of rows materialized in the results treeview at a time.
+    # The treeview acts as a window over self.all_rows so huge scans
+    # don't blow up Tk-side memory or redraw time.
+    VIEW_ROWS = 100
+    # Rows appended per after() callback while rebuilding the row arrays
+    BUILD_CHUNK = 1000
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("PhotoPuller - Find & Organize Photos & Videos")
@@ -35,8 +77,18 @@ class PhotoPullerGUI:
         style.configure('Status.TLabel', font=('Segoe UI', 8))
         
         self.core = PhotoPullerCore()  # Use core class for business logic
-        self.file_to_item_map = {}  # Map file paths to treeview items
+        self.all_rows = []  # Formatted (path, type, size, date) row per visible file
+        self.path_to_idx = {}  # Map file paths to row indices
         self.file_copy_status = {}  # Track copy status for each file
+        self._view_offset = 0  # Index of the first row shown in the treeview
+        self._visible_items = []  # Treeview item IDs for the visible window, by offset
+        self._build_generation = 0  # Bumped per rebuild to cancel stale chunk callbacks
+        self._last_scan_path = None  # Last path shown in the scan progress label
+        self._last_file_percent = -1  # Last per-file copy percentage applied
+        self._excluded_snapshot = []  # Sorted folder strings currently in the listbox
+        self._excluded_snapshot_set = set()
+        self._copy_button_after_id = None  # Pending debounced button update
+        self._copy_button_enabled = False  # Current copy button state
         self.scan_photos = tk.BooleanVar(value=True)  # Filter for photos
         self.scan_videos = tk.BooleanVar(value=True)  # Filter for videos
         self.scan_pdfs = tk.BooleanVar(value=True)  # Filter for PDFs
@@ -47,10 +99,17 @@ class PhotoPullerGUI:
         # Load excluded folders on startup
         self.load_excluded_folders()
         
+        # Progress events from worker threads; drained by one repeating timer
+        # instead of scheduling an after(0) callback per event
+        self.progress_q = queue.Queue()
+
         self.setup_ui()
-        
+
         # Populate excluded folders listbox after UI is created
         self.update_excluded_listbox()
+
+        # Single polling timer for all worker progress
+        self.root.after(50, self._drain_progress_q)
     
     def setup_ui(self):
         """Set up the user interface"""
@@ -147,8 +206,9 @@ class PhotoPullerGUI:
         dest_entry = ttk.Entry(dest_frame, textvariable=self.dest_var, width=32)
         dest_entry.grid(row=0, column=0, padx=(0, 6), pady=4, sticky=(tk.W, tk.E))
         dest_frame.columnconfigure(0, weight=1)
-        # Trace destination changes to update copy button state
-        self.dest_var.trace_add('write', lambda *args: self.update_copy_button_state())
+        # Trace destination changes to update copy button state (debounced
+        # so rapid typing only triggers one check)
+        self.dest_var.trace_add('write', lambda *args: self._schedule_copy_button_update())
         
         ttk.Button(dest_frame, text="Browse...", 
                   command=self.browse_destination, width=12).grid(row=0, column=1, padx=0)
@@ -225,26 +285,38 @@ class PhotoPullerGUI:
         self.results_tree.heading("Size", text="Size")
         self.results_tree.heading("Date", text="Modified")
         
+        # Per-status row styling; configured once, applied via tags
+        self.results_tree.tag_configure('copied', foreground='green')
+        self.results_tree.tag_configure('skipped', foreground='gray')
+        self.results_tree.tag_configure('error', foreground='red')
+        self.results_tree.tag_configure('duplicate', foreground='orange')
+        self.results_tree.tag_configure('would_copy', foreground='green')
+        self.results_tree.tag_configure('copying', foreground='blue')
+
         self.results_tree.column("#0", width=90, anchor=tk.W)
         self.results_tree.column("File Path", width=280, anchor=tk.W)
         self.results_tree.column("Type", width=70, anchor=tk.W)
         self.results_tree.column("Size", width=90, anchor=tk.W)
         self.results_tree.column("Date", width=130, anchor=tk.W)
         
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
-        self.results_tree.configure(yscrollcommand=scrollbar.set)
-        
+        # The scrollbar is virtual: it scrolls self.all_rows, not the
+        # treeview itself, which only ever holds VIEW_ROWS items
+        self.results_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL,
+                                               command=self._on_tree_scroll)
+        self.results_tree.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.results_tree.bind('<Button-4>', self._on_mouse_wheel)
+        self.results_tree.bind('<Button-5>', self._on_mouse_wheel)
+
         self.results_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.results_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         tree_frame.columnconfigure(0, weight=1)
         tree_frame.rowconfigure(0, weight=1)
         
-        # Create context menu for right-click
-        self.context_menu = tk.Menu(self.root, tearoff=0)
-        self.context_menu.add_command(label="Open File Location", command=self.open_file_location)
-        self.context_menu.add_separator()
-        self.context_menu.add_command(label="Exclude Parent Folder", command=self.exclude_parent_folder)
-        
+        # Context menu and edit dialog are built lazily on first use;
+        # Toplevel/Menu creation costs Tcl window registration
+        self.context_menu = None
+        self._edit_window = None
+
         # Bind right-click to show context menu
         self.results_tree.bind("<Button-3>", self.show_context_menu)
         
@@ -286,16 +358,33 @@ class PhotoPullerGUI:
     def scan_drive(self, source_path):
         """Scan drive for files (runs in thread)"""
         try:
+            # Rate-limit progress updates: the scanner fires the callback per
+            # directory, which on a fast drive floods the Tk event queue with
+            # after(0) callbacks and stalls the UI. ~20 updates/sec is plenty.
+            last_update = [0.0]
+
             def progress_callback(current_path, stats):
-                self.root.after(0, self.update_scan_progress, current_path, stats)
+                now = time.monotonic()
+                if now - last_update[0] < 0.05:
+                    return
+                last_update[0] = now
+                # Format here, on the worker thread, so the main-thread
+                # handler is nothing but StringVar writes
+                stats_text = (
+                    f"Found: {stats.photos_found} photos, "
+                    f"{stats.videos_found} videos, {stats.pdfs_found} PDFs"
+                )
+                display_path = self._format_display_path(current_path)
+                self.progress_q.put(('scan', stats_text, display_path))
             
             # Get filter settings
             scan_photos = self.scan_photos.get()
             scan_videos = self.scan_videos.get()
             scan_pdfs = self.scan_pdfs.get()
             
-            # Get excluded folders as list of strings
-            excluded_folders = [str(f) for f in self.core.excluded_folders]
+            # Excluded folders are already plain strings; the cached view
+            # avoids both the copy and the per-item str() round trip
+            excluded_folders = self.core.excluded_folders_str
             
             # Use core to scan
             self.core.scan(
@@ -317,35 +406,35 @@ class PhotoPullerGUI:
             self.root.after(0, lambda: messagebox.showerror("Scan Error", str(e)))
             self.root.after(0, self.scan_failed)
     
-    def update_scan_progress(self, current_path, stats):
-        """Update scan progress (called from main thread)"""
-        # Update stats on first line
-        pdfs_count = stats.get('pdfs_found', 0)
-        self.scan_progress_var.set(
-            f"Found: {stats.get('photos_found', 0)} photos, {stats.get('videos_found', 0)} videos, {pdfs_count} PDFs"
-        )
-        
-        # Show current file path on second line (truncate if too long)
-        max_path_length = 60
-        if len(current_path) > max_path_length:
-            # Show just the last part of the path (filename and parent folder)
-            path_parts = current_path.replace('\\', '/').split('/')
-            if len(path_parts) > 1:
-                # Try to show last folder and filename
-                display_path = '/'.join(path_parts[-2:])
-            else:
-                display_path = path_parts[-1] if path_parts else current_path
-            
-            # If still too long, truncate with ellipsis
-            if len(display_path) > max_path_length:
-                display_path = "..." + display_path[-(max_path_length-3):]
-        else:
-            display_path = current_path
-        
-        self.scan_current_file_var.set(f"Scanning: {display_path}")
+    @staticmethod
+    def _format_display_path(current_path, max_path_length=60):
+        """Truncate a path for display (safe to call from worker threads)"""
+        if len(current_path) <= max_path_length:
+            return current_path
+
+        # Show just the last folder and filename; os.path.split/basename are
+        # C-level and much cheaper than a replace+split+join dance
+        head, tail = os.path.split(current_path)
+        display_path = f"{os.path.basename(head)}/{tail}" if head else tail
+
+        # If still too long, truncate with ellipsis
+        if len(display_path) > max_path_length:
+            display_path = "..." + display_path[-(max_path_length-3):]
+        return display_path
+
+    def _apply_scan_progress(self, stats_text, display_path):
+        """Apply preformatted scan progress (called from main thread)"""
+        set_if_changed(self.scan_progress_var, stats_text)
+
+        # Skip the StringVar write (and the redraw it triggers) if unchanged
+        if display_path != self._last_scan_path:
+            self._last_scan_path = display_path
+            self.scan_current_file_var.set(f"Scanning: {display_path}")
     
     def scan_complete(self):
         """Handle scan completion"""
+        # Flush any queued progress so it can't overwrite the final text
+        self._process_progress_events()
         self.scan_progress_bar.stop()
         stats = self.core.get_scan_stats()
         self.scan_progress_var.set(
@@ -360,26 +449,60 @@ class PhotoPullerGUI:
         # Update copy button state
         self.update_copy_button_state()
     
+    def _schedule_copy_button_update(self):
+        """Debounce copy-button updates triggered by typing in the entry"""
+        if self._copy_button_after_id is not None:
+            self.root.after_cancel(self._copy_button_after_id)
+        self._copy_button_after_id = self.root.after(100, self.update_copy_button_state)
+
     def update_copy_button_state(self):
         """Update the copy button state based on current conditions"""
+        self._copy_button_after_id = None
         if not self.copy_button:
             return
-        
+
         # Enable button if: destination is set AND there are files to copy
-        has_destination = bool(self.dest_var.get().strip())
-        has_files = len(self.core.found_files) > 0
-        
-        if has_destination and has_files:
-            self.copy_button.config(state=tk.NORMAL)
-        else:
-            self.copy_button.config(state=tk.DISABLED)
+        enable = bool(self.dest_var.get().strip()) and self.core.has_files
+
+        # Skip the Tk config call when the state wouldn't change
+        if enable != self._copy_button_enabled:
+            self._copy_button_enabled = enable
+            self.copy_button.config(state=tk.NORMAL if enable else tk.DISABLED)
     
     def update_excluded_listbox(self):
-        """Update the excluded folders listbox display"""
-        if hasattr(self, 'excluded_listbox'):
-            self.excluded_listbox.delete(0, tk.END)
-            for folder in sorted(self.core.excluded_folders):
-                self.excluded_listbox.insert(tk.END, str(folder))
+        """Sync the excluded folders listbox with the core's exclusion set.
+
+        Keeps a sorted snapshot of what the listbox currently shows and only
+        applies the differences, so calls where nothing changed (e.g. every
+        scan completion) cost one set comparison instead of a sort plus a
+        full listbox rebuild.
+        """
+        if not hasattr(self, 'excluded_listbox'):
+            return
+
+        current = set(self.core.excluded_folders)
+        if current == self._excluded_snapshot_set:
+            return
+
+        old = self._excluded_snapshot
+        new = sorted(current)
+
+        # Merge-walk old vs new, deleting/inserting only the changed rows;
+        # j is both the position in `new` and the live listbox index
+        i = j = 0
+        while i < len(old) or j < len(new):
+            if i < len(old) and (j >= len(new) or old[i] < new[j]):
+                self.excluded_listbox.delete(j)
+                i += 1
+            elif i < len(old) and old[i] == new[j]:
+                i += 1
+                j += 1
+            else:
+                self.excluded_listbox.insert(j, new[j])
+                j += 1
+
+        self._excluded_snapshot = new
+        self._excluded_snapshot_set = current
     
     def apply_exclusions(self):
         """Filter results based on excluded folders"""
@@ -392,35 +515,50 @@ class PhotoPullerGUI:
         # Update excluded folders listbox
         self.update_excluded_listbox()
         
-        # Populate results tree
-        self.results_tree.delete(*self.results_tree.get_children())
+        # Rebuild the row arrays backing the virtual treeview in chunks
+        # spread across after() callbacks: the first window paints
+        # immediately and a 500k-file scan never stalls the event loop or
+        # materializes every formatted row up front.
         # Preserve copy statuses when repopulating (e.g., after exclusion changes)
         preserved_statuses = self.file_copy_status.copy()
-        self.file_to_item_map.clear()
         self.file_copy_status.clear()
-        
-        for file_path, file_info in zip(self.found_files, self.file_infos):
-            if 'error' not in file_info:
-                if file_info.get('is_photo', False):
-                    file_type = "Photo"
-                elif file_info.get('is_video', False):
-                    file_type = "Video"
-                elif file_info.get('is_pdf', False):
-                    file_type = "PDF"
-                else:
-                    file_type = "Unknown"
-                size_mb = file_info['size'] / (1024 * 1024)
-                date_str = file_info['modified'].strftime("%Y-%m-%d %H:%M")
-                file_path_str = str(file_path)
-                
-                # Preserve status if file was previously in the list, otherwise default to "Not Copied"
-                status = preserved_statuses.get(file_path_str, "Not Copied")
-                self.file_copy_status[file_path_str] = status
-                
-                item = self.results_tree.insert("", tk.END, text=status,
-                                                values=(file_path_str, file_type, f"{size_mb:.2f} MB", date_str))
-                self.file_to_item_map[file_path_str] = item
-        
+        self.all_rows = []
+        self.path_to_idx = {}
+        self._view_offset = 0
+        self._build_generation += 1
+        self._build_rows_chunk(self._build_generation, preserved_statuses, 0)
+
+    def _build_rows_chunk(self, generation, preserved_statuses, start):
+        """Append one chunk of display rows, rescheduling itself until done"""
+        if generation != self._build_generation:
+            return  # superseded by a newer rebuild
+
+        rows = self.all_rows
+        path_to_idx = self.path_to_idx
+        statuses = self.file_copy_status
+        get_status = preserved_statuses.get
+        stop = start + self.BUILD_CHUNK
+        for file_path, file_info in zip(self.found_files[start:stop],
+                                        self.file_infos[start:stop]):
+            if file_info.error is None:
+                # Scan results are plain strings end to end; no str() copy
+                statuses[file_path] = get_status(file_path, _NOT_COPIED)
+                path_to_idx[file_path] = len(rows)
+                rows.append((file_path, file_info.type_str,
+                             file_info.size_str, file_info.date_str))
+
+        if start == 0:
+            # First chunk fills the visible window; later chunks only need
+            # to keep the scrollbar proportions in step
+            self.refresh_results_view()
+        else:
+            self._update_results_scrollbar()
+
+        if stop < len(self.found_files):
+            self.root.after(1, self._build_rows_chunk,
+                            generation, preserved_statuses, stop)
+            return
+
         # Update stats using core
         stats = self.core.get_scan_stats()
         self.stats_var.set(
@@ -428,7 +566,88 @@ class PhotoPullerGUI:
             f"{stats['photos']} photos, {stats['videos']} videos, {stats['pdfs']} PDFs, "
             f"Total size: {stats['total_size_gb']:.2f} GB"
         )
-    
+
+    def refresh_results_view(self):
+        """Repopulate the treeview with the rows inside the visible window"""
+        tree = self.results_tree
+        tree.delete(*tree.get_children())
+
+        total = len(self.all_rows)
+        max_offset = max(0, total - self.VIEW_ROWS)
+        self._view_offset = min(max(self._view_offset, 0), max_offset)
+        offset = self._view_offset
+
+        insert = tree.insert
+        end = tk.END
+        get_status = self.file_copy_status.get
+        # Hide the data columns while refilling the window so Tk does one
+        # layout pass at the end instead of one per inserted row
+        display_columns = tree.cget('displaycolumns')
+        tree.configure(displaycolumns=())
+        try:
+            self._visible_items = []
+            append = self._visible_items.append
+            for row in self.all_rows[offset:offset + self.VIEW_ROWS]:
+                status = get_status(row[0], _NOT_COPIED)
+                append(insert("", end, text=status,
+                              tags=(_STATUS_TAG.get(status, 'not_copied'),),
+                              values=row))
+        finally:
+            tree.configure(displaycolumns=display_columns)
+
+        self._update_results_scrollbar()
+
+    def _update_results_scrollbar(self):
+        """Reflect the virtual window position in the scrollbar"""
+        total = len(self.all_rows)
+        if total <= self.VIEW_ROWS:
+            self.results_scrollbar.set(0.0, 1.0)
+        else:
+            first = self._view_offset / total
+            last = min(1.0, (self._view_offset + self.VIEW_ROWS) / total)
+            self.results_scrollbar.set(first, last)
+
+    def _scroll_results_to(self, offset):
+        """Move the virtual window and refresh if it actually moved"""
+        total = len(self.all_rows)
+        offset = min(max(offset, 0), max(0, total - self.VIEW_ROWS))
+        if offset != self._view_offset:
+            self._view_offset = offset
+            self.refresh_results_view()
+
+    def _on_tree_scroll(self, *args):
+        """Handle scrollbar commands against the virtual row list"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._scroll_results_to(int(float(args[1]) * len(self.all_rows)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            step = self.VIEW_ROWS if args[2] == 'pages' else 3
+            self._scroll_results_to(self._view_offset + amount * step)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll the virtual window with the mouse wheel"""
+        if event.num == 4:  # X11 scroll up
+            delta = -3
+        elif event.num == 5:  # X11 scroll down
+            delta = 3
+        else:  # Windows: delta is a multiple of 120
+            delta = -3 * (event.delta // 120)
+        self._scroll_results_to(self._view_offset + delta)
+        return "break"
+
+    def _set_row_status(self, file_path_str, status):
+        """Update a row's copy status and its treeview item if visible"""
+        self.file_copy_status[file_path_str] = status
+        idx = self.path_to_idx.get(file_path_str)
+        if idx is None:
+            return
+        visible = idx - self._view_offset
+        if 0 <= visible < len(self._visible_items):
+            self.results_tree.item(self._visible_items[visible], text=status,
+                                   tags=(_STATUS_TAG.get(status, 'not_copied'),))
+
     def scan_failed(self):
         """Handle scan failure"""
         self.scan_progress_bar.stop()
@@ -448,6 +667,7 @@ class PhotoPullerGUI:
         
         # Disable copy button and start progress
         if self.copy_button:
+            self._copy_button_enabled = False
             self.copy_button.config(state=tk.DISABLED)
         self.copy_progress_bar['maximum'] = len(self.found_files)
         self.copy_progress_bar['value'] = 0
@@ -458,10 +678,10 @@ class PhotoPullerGUI:
         self.copy_rate_var.set("")
         
         # Reset all file statuses to "Not Copied" (except those already copied)
-        for file_path_str, item in self.file_to_item_map.items():
-            if self.file_copy_status.get(file_path_str, "Not Copied") not in ['✓ Copied', '⊘ Skipped', '✗ Error', '↻ Duplicate']:
-                self.results_tree.item(item, text="Not Copied")
-                self.file_copy_status[file_path_str] = "Not Copied"
+        for file_path_str in self.path_to_idx:
+            if self.file_copy_status.get(file_path_str, _NOT_COPIED) not in ['✓ Copied', '⊘ Skipped', '✗ Error', '↻ Duplicate']:
+                self.file_copy_status[file_path_str] = _NOT_COPIED
+        self.refresh_results_view()
         
         # Start copy in thread
         organize_method = self.org_method_var.get()
@@ -472,12 +692,49 @@ class PhotoPullerGUI:
     def copy_files(self, destination, organize_method):
         """Copy files (runs in thread)"""
         try:
+            # Format progress strings on the worker thread; the main-thread
+            # handlers only apply precomputed values to widgets
+            last_stats = [None, ""]
+
             def progress_callback(current_file, stats, copy_status=None):
-                self.root.after(0, self.update_copy_progress, current_file, stats, copy_status)
-            
+                done = stats.copied + stats.skipped + stats.errors
+                # Only rebuild the stats line when a counter actually changed
+                counters = (stats.copied, stats.skipped,
+                            stats.errors, stats.duplicates)
+                if counters != last_stats[0]:
+                    last_stats[0] = counters
+                    last_stats[1] = (
+                        f"Copied: {counters[0]}, Skipped: {counters[1]}, "
+                        f"Errors: {counters[2]}, Duplicates: {counters[3]}"
+                    )
+                stats_text = last_stats[1]
+                file_name = os.path.basename(current_file)
+                if len(file_name) > 60:
+                    file_name = "..." + file_name[-57:]
+                self.progress_q.put(('copy', done, stats_text, file_name,
+                                     current_file, copy_status))
+
+            last_file_update = [0.0]
+
             def file_progress_callback(bytes_copied, total_bytes, copy_rate_mbps):
-                self.root.after(0, self.update_file_copy_progress, 
-                              bytes_copied, total_bytes, copy_rate_mbps)
+                # The organizer can report every chunk; on a fast disk that is
+                # hundreds of events per second. Throttle to ~20Hz but always
+                # deliver the final update for the file.
+                now = time.monotonic()
+                if bytes_copied != total_bytes and now - last_file_update[0] < 0.05:
+                    return
+                last_file_update[0] = now
+                if total_bytes > 0:
+                    progress_percent = (bytes_copied / total_bytes) * 100
+                    bytes_mb = bytes_copied / (1024 * 1024)
+                    total_mb = total_bytes / (1024 * 1024)
+                    rate_text = (
+                        f"{bytes_mb:.2f} MB / {total_mb:.2f} MB ({progress_percent:.1f}%) - "
+                        f"Speed: {copy_rate_mbps:.2f} MB/s"
+                    )
+                else:
+                    rate_text = ""
+                self.progress_q.put(('file', bytes_copied, total_bytes, rate_text))
             
             # Use core to copy files
             results = self.core.copy_files(
@@ -495,60 +752,70 @@ class PhotoPullerGUI:
             self.root.after(0, lambda: messagebox.showerror("Copy Error", str(e)))
             self.root.after(0, self.copy_failed)
     
-    def update_copy_progress(self, current_file, stats, copy_status=None):
-        """Update copy progress (called from main thread)"""
-        self.copy_progress_bar['value'] = stats['copied'] + stats['skipped'] + stats['errors']
-        self.copy_progress_var.set(
-            f"Copied: {stats['copied']}, Skipped: {stats['skipped']}, "
-            f"Errors: {stats['errors']}, Duplicates: {stats['duplicates']}"
-        )
-        
-        # Update current file display (truncate if too long)
-        file_name = Path(current_file).name
-        if len(file_name) > 60:
-            file_name = "..." + file_name[-57:]
-        self.copy_current_file_var.set(f"Copying: {file_name}")
-        
-        # Update status in treeview
-        if current_file in self.file_to_item_map:
-            item = self.file_to_item_map[current_file]
+    def _drain_progress_q(self):
+        """Apply all pending worker progress, then reschedule (main thread)"""
+        self._process_progress_events()
+        self.root.after(50, self._drain_progress_q)
+
+    def _process_progress_events(self):
+        """Drain the progress queue, applying only the newest of each kind.
+
+        Per-file copy statuses are applied for every event (they each target
+        a different row); the shared labels/bars only get the latest value.
+        """
+        scan_evt = copy_evt = file_evt = None
+        while True:
+            try:
+                evt = self.progress_q.get_nowait()
+            except queue.Empty:
+                break
+            kind = evt[0]
+            if kind == 'scan':
+                scan_evt = evt
+            elif kind == 'copy':
+                self._apply_copy_status(evt[4], evt[5])
+                copy_evt = evt
+            else:  # 'file'
+                file_evt = evt
+
+        if scan_evt is not None:
+            self._apply_scan_progress(scan_evt[1], scan_evt[2])
+        if copy_evt is not None:
+            self.copy_progress_bar['value'] = copy_evt[1]
+            set_if_changed(self.copy_progress_var, copy_evt[2])
+            set_if_changed(self.copy_current_file_var, f"Copying: {copy_evt[3]}")
+        if file_evt is not None:
+            self._apply_file_copy_progress(file_evt[1], file_evt[2], file_evt[3])
+
+    def _apply_copy_status(self, current_file, copy_status):
+        """Update a file's status in the virtual row list (main thread)"""
+        if current_file in self.path_to_idx:
             if copy_status:
                 # Update with final status
-                status_text = {
-                    'copied': '✓ Copied',
-                    'skipped': '⊘ Skipped',
-                    'error': '✗ Error',
-                    'duplicate': '↻ Duplicate',
-                    'would_copy': '✓ Would Copy'  # For dry-run
-                }.get(copy_status, 'Unknown')
-                self.results_tree.item(item, text=status_text)
-                self.file_copy_status[current_file] = status_text
+                self._set_row_status(current_file, _STATUS_TEXT.get(copy_status, 'Unknown'))
             else:
                 # Update to "Copying" status
-                self.results_tree.item(item, text="Copying...")
-                self.file_copy_status[current_file] = "Copying..."
+                self._set_row_status(current_file, _COPYING)
     
-    def update_file_copy_progress(self, bytes_copied, total_bytes, copy_rate_mbps):
-        """Update per-file copy progress (called from main thread)"""
-        # Update per-file progress bar
+    def _apply_file_copy_progress(self, bytes_copied, total_bytes, rate_text):
+        """Apply preformatted per-file copy progress (called from main thread)"""
         if total_bytes > 0:
-            progress_percent = (bytes_copied / total_bytes) * 100
+            # Skip the widget writes when the integer percentage hasn't moved
+            percent = bytes_copied * 100 // total_bytes
+            if percent == self._last_file_percent and bytes_copied != total_bytes:
+                return
+            self._last_file_percent = percent
             self.copy_file_progress_bar['maximum'] = total_bytes
             self.copy_file_progress_bar['value'] = bytes_copied
-            
-            # Update copy rate display
-            bytes_mb = bytes_copied / (1024 * 1024)
-            total_mb = total_bytes / (1024 * 1024)
-            self.copy_rate_var.set(
-                f"{bytes_mb:.2f} MB / {total_mb:.2f} MB ({progress_percent:.1f}%) - "
-                f"Speed: {copy_rate_mbps:.2f} MB/s"
-            )
         else:
+            self._last_file_percent = -1
             self.copy_file_progress_bar['value'] = 0
-            self.copy_rate_var.set("")
+        set_if_changed(self.copy_rate_var, rate_text)
     
     def copy_complete(self, results):
         """Handle copy completion"""
+        # Flush any queued progress so it can't overwrite the final text
+        self._process_progress_events()
         stats = self.core.get_copy_stats()
         self.copy_progress_var.set(
             f"Copy complete! Copied: {stats.get('copied', 0)}, "
@@ -561,6 +828,7 @@ class PhotoPullerGUI:
         self.copy_rate_var.set("")
         
         if self.copy_button:
+            self._copy_button_enabled = True
             self.copy_button.config(state=tk.NORMAL)
         
         messagebox.showinfo(
@@ -579,10 +847,18 @@ class PhotoPullerGUI:
         self.copy_current_file_var.set("")
         self.copy_rate_var.set("")
         if self.copy_button:
+            self._copy_button_enabled = True
             self.copy_button.config(state=tk.NORMAL)
     
     def show_context_menu(self, event):
         """Show context menu on right-click"""
+        # Create the menu on first use
+        if self.context_menu is None:
+            self.context_menu = tk.Menu(self.root, tearoff=0)
+            self.context_menu.add_command(label="Open File Location", command=self.open_file_location)
+            self.context_menu.add_separator()
+            self.context_menu.add_command(label="Exclude Parent Folder", command=self.exclude_parent_folder)
+
         # Select the item under the cursor
         item = self.results_tree.identify_row(event.y)
         if item:
@@ -616,15 +892,15 @@ class PhotoPullerGUI:
             return
         
         try:
-            file_path = Path(file_path_str)
-            if not file_path.exists():
+            if not os.path.exists(file_path_str):
                 messagebox.showerror("Error", f"File does not exist:\n{file_path_str}")
                 return
-            
-            # Open the folder containing the file in Windows Explorer
-            # Use explorer.exe with /select to highlight the file
-            folder_path = file_path.parent
-            subprocess.Popen(f'explorer.exe /select,"{file_path}"', shell=True)
+
+            # Open the folder containing the file in Windows Explorer.
+            # Use explorer.exe with /select to highlight the file; launching
+            # it directly (no shell=True) skips the cmd.exe hop and avoids
+            # quoting problems with odd characters in the path
+            subprocess.Popen(['explorer.exe', '/select,', file_path_str])
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open file location:\n{str(e)}")
@@ -653,11 +929,10 @@ class PhotoPullerGUI:
             return
         
         try:
-            file_path = Path(file_path_str)
-            parent_folder = file_path.parent
-            
+            parent_folder = os.path.dirname(file_path_str)
+
             # Add to excluded folders using core
-            self.core.add_excluded_folder(str(parent_folder))
+            self.core.add_excluded_folder(parent_folder)
             
             # Save excluded folders to file
             self.save_excluded_folders()
@@ -668,65 +943,78 @@ class PhotoPullerGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to exclude folder:\n{str(e)}")
     
-    def edit_exclusion(self):
-        """Edit the selected excluded folder path"""
-        selection = self.excluded_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a folder to edit")
-            return
-        
-        index = selection[0]
-        folder_str = self.excluded_listbox.get(index)
-        folder_path = Path(folder_str)
-        
-        # Create a dialog to edit the path
+    def _build_edit_window(self):
+        """Create the (reusable) edit-exclusion dialog, initially hidden"""
         edit_window = tk.Toplevel(self.root)
         edit_window.title("Edit Excluded Folder")
         edit_window.geometry("500x100")
-        edit_window.transient(self.root)
-        edit_window.grab_set()
-        
+        edit_window.withdraw()
+
         ttk.Label(edit_window, text="Folder Path:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        path_var = tk.StringVar(value=str(folder_path))
-        path_entry = ttk.Entry(edit_window, textvariable=path_var, width=55)
+        self._edit_path_var = tk.StringVar()
+        path_entry = ttk.Entry(edit_window, textvariable=self._edit_path_var, width=55)
         path_entry.grid(row=0, column=1, padx=(0, 12), pady=12, sticky=(tk.W, tk.E))
         edit_window.columnconfigure(1, weight=1)
-        
-        def save_changes():
-            new_path_str = path_var.get().strip()
-            if not new_path_str:
-                messagebox.showwarning("Warning", "Path cannot be empty")
-                return
-            
-            # Remove old path and add new path using core
-            self.core.remove_excluded_folder(folder_str)
-            self.core.add_excluded_folder(new_path_str)
-            
-            # Save excluded folders to file
-            self.save_excluded_folders()
-            
-            # Reapply exclusions to update the display
-            self.apply_exclusions()
-            edit_window.destroy()
-        
-        def cancel():
-            edit_window.destroy()
-        
-        def on_enter(event):
-            """Handle Enter key press"""
-            save_changes()
-        
+
         # Bind Enter key to save
-        path_entry.bind('<Return>', on_enter)
-        edit_window.bind('<Return>', on_enter)
-        
+        path_entry.bind('<Return>', lambda event: self._save_edit_exclusion())
+        edit_window.bind('<Return>', lambda event: self._save_edit_exclusion())
+        edit_window.protocol("WM_DELETE_WINDOW", self._close_edit_window)
+
         button_frame = ttk.Frame(edit_window)
         button_frame.grid(row=1, column=0, columnspan=2, pady=(0, 12))
-        ttk.Button(button_frame, text="Save", command=save_changes, width=12).grid(row=0, column=0, padx=(0, 6))
-        ttk.Button(button_frame, text="Cancel", command=cancel, width=12).grid(row=0, column=1, padx=0)
-        
-        path_entry.focus()
-        path_entry.select_range(0, tk.END)
+        ttk.Button(button_frame, text="Save", command=self._save_edit_exclusion,
+                   width=12).grid(row=0, column=0, padx=(0, 6))
+        ttk.Button(button_frame, text="Cancel", command=self._close_edit_window,
+                   width=12).grid(row=0, column=1, padx=0)
+
+        self._edit_window = edit_window
+        self._edit_path_entry = path_entry
+
+    def _save_edit_exclusion(self):
+        """Apply the edited exclusion path and hide the dialog"""
+        new_path_str = self._edit_path_var.get().strip()
+        if not new_path_str:
+            messagebox.showwarning("Warning", "Path cannot be empty")
+            return
+
+        # Remove old path and add new path using core
+        self.core.remove_excluded_folder(self._edit_original)
+        self.core.add_excluded_folder(new_path_str)
+
+        # Save excluded folders to file
+        self.save_excluded_folders()
+
+        # Reapply exclusions to update the display
+        self.apply_exclusions()
+        self._close_edit_window()
+
+    def _close_edit_window(self):
+        """Hide the edit dialog instead of destroying it so it can be reused"""
+        self._edit_window.grab_release()
+        self._edit_window.withdraw()
+
+    def edit_exclusion(self):
+        """Edit the selected excluded folder path"""
+        selection = self.excluded_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a folder to edit")
+            return
+
+        folder_str = self.excluded_listbox.get(selection[0])
+
+        # Build the dialog on first use, then just show it again with the
+        # selected path - Toplevel creation is too slow to repeat per edit
+        if self._edit_window is None:
+            self._build_edit_window()
+
+        self._edit_original = folder_str
+        self._edit_path_var.set(folder_str)
+        self._edit_window.deiconify()
+        self._edit_window.transient(self.root)
+        self._edit_window.grab_set()
+        self._edit_path_entry.focus()
+        self._edit_path_entry.select_range(0, tk.END)
     
     def remove_exclusion(self):
         """Remove the selected folder from exclusions"""
@@ -778,10 +1066,9 @@ class PhotoPullerGUI:
     def save_excluded_folders(self):
         """Save excluded folders to JSON file"""
         try:
-            # Convert Path objects to strings for JSON serialization
-            excluded_folders = [str(folder) for folder in self.core.excluded_folders]
+            # Already strings; the cached sorted view serializes directly
             data = {
-                'excluded_folders': excluded_folders
+                'excluded_folders': self.core.excluded_folders_str
             }
             with open(self.excluded_folders_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -1,478 +1,631 @@
-"""
-PhotoPuller MCP Server
-Exposes PhotoPuller functionality to AI agents via Model Context Protocol
-"""
-import json
-import sys
-from typing import Any, Dict, List, Optional
-from pathlib import Path
-from photopuller_core import PhotoPullerCore
-
-
-class PhotoPullerMCPServer:
-    """MCP Server for PhotoPuller that exposes tools to AI agents"""
-    
-    def __init__(self):
-        self.core = PhotoPullerCore()
-        self.scan_results = []
-    
-    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle an MCP request"""
-        method = request.get("method")
-        params = request.get("params", {})
-        request_id = request.get("id")
-        
-        try:
-            if method == "tools/list":
-                result = self.list_tools()
-            elif method == "tools/call":
-                result = self.call_tool(params.get("name"), params.get("arguments", {}))
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                }
-            
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": result
-            }
-        except Exception as e:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }
-    
-    def list_tools(self) -> Dict[str, Any]:
-        """List available MCP tools"""
-        return {
-            "tools": [
-                {
-                    "name": "photopuller_scan",
-                    "description": "Scan a drive or directory for photos, videos, and PDFs",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "source_path": {
-                                "type": "string",
-                                "description": "Path to scan (e.g., 'C:\\' or 'D:\\Photos')"
-                            },
-                            "scan_photos": {
-                                "type": "boolean",
-                                "description": "Include photos in scan",
-                                "default": True
-                            },
-                            "scan_videos": {
-                                "type": "boolean",
-                                "description": "Include videos in scan",
-                                "default": True
-                            },
-                            "scan_pdfs": {
-                                "type": "boolean",
-                                "description": "Include PDFs in scan",
-                                "default": True
-                            },
-                            "excluded_folders": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of folder paths to exclude from scan",
-                                "default": []
-                            }
-                        },
-                        "required": ["source_path"]
-                    }
-                },
-                {
-                    "name": "photopuller_get_scan_stats",
-                    "description": "Get statistics about the last scan operation",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                },
-                {
-                    "name": "photopuller_copy_files",
-                    "description": "Copy scanned files to a destination directory with organization",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "destination": {
-                                "type": "string",
-                                "description": "Destination directory path"
-                            },
-                            "organize_method": {
-                                "type": "string",
-                                "enum": ["date", "source"],
-                                "description": "Organization method: 'date' (Year/Month) or 'source' (by drive)",
-                                "default": "date"
-                            },
-                            "dry_run": {
-                                "type": "boolean",
-                                "description": "If true, simulate copying without actually copying files",
-                                "default": False
-                            }
-                        },
-                        "required": ["destination"]
-                    }
-                },
-                {
-                    "name": "photopuller_get_copy_stats",
-                    "description": "Get statistics about the last copy operation",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                },
-                {
-                    "name": "photopuller_add_exclusion",
-                    "description": "Add a folder to the exclusion list",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "folder_path": {
-                                "type": "string",
-                                "description": "Path to folder to exclude"
-                            }
-                        },
-                        "required": ["folder_path"]
-                    }
-                },
-                {
-                    "name": "photopuller_remove_exclusion",
-                    "description": "Remove a folder from the exclusion list",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "folder_path": {
-                                "type": "string",
-                                "description": "Path to folder to remove from exclusions"
-                            }
-                        },
-                        "required": ["folder_path"]
-                    }
-                },
-                {
-                    "name": "photopuller_clear_exclusions",
-                    "description": "Clear all excluded folders",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            ]
-        }
-    
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a specific tool with given arguments"""
-        if tool_name == "photopuller_scan":
-            return self._scan(arguments)
-        elif tool_name == "photopuller_get_scan_stats":
-            return self._get_scan_stats()
-        elif tool_name == "photopuller_copy_files":
-            return self._copy_files(arguments)
-        elif tool_name == "photopuller_get_copy_stats":
-            return self._get_copy_stats()
-        elif tool_name == "photopuller_add_exclusion":
-            return self._add_exclusion(arguments)
-        elif tool_name == "photopuller_remove_exclusion":
-            return self._remove_exclusion(arguments)
-        elif tool_name == "photopuller_clear_exclusions":
-            return self._clear_exclusions()
-        else:
-            raise ValueError(f"Unknown tool: {tool_name}")
-    
-    def _scan(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Scan for files"""
-        source_path = args["source_path"]
-        scan_photos = args.get("scan_photos", True)
-        scan_videos = args.get("scan_videos", True)
-        scan_pdfs = args.get("scan_pdfs", True)
-        excluded_folders = args.get("excluded_folders", [])
-        
-        # Collect progress updates
-        progress_updates = []
-        
-        def progress_callback(current_path, stats):
-            progress_updates.append({
-                "current_path": str(current_path),
-                "stats": stats.copy()
-            })
-        
-        try:
-            found_files = self.core.scan(
-                source_path,
-                scan_photos=scan_photos,
-                scan_videos=scan_videos,
-                scan_pdfs=scan_pdfs,
-                excluded_folders=excluded_folders,
-                progress_callback=progress_callback
-            )
-            
-            stats = self.core.get_scan_stats()
-            
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "success",
-                            "files_found": len(found_files),
-                            "stats": stats,
-                            "sample_files": [str(f) for f in found_files[:10]]  # First 10 files as sample
-                        }, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _get_scan_stats(self) -> Dict[str, Any]:
-        """Get scan statistics"""
-        try:
-            stats = self.core.get_scan_stats()
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(stats, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _copy_files(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Copy files to destination"""
-        destination = args["destination"]
-        organize_method = args.get("organize_method", "date")
-        dry_run = args.get("dry_run", False)
-        
-        # Collect progress updates
-        progress_updates = []
-        
-        def progress_callback(current_file, copy_stats, copy_status=None):
-            progress_updates.append({
-                "current_file": str(current_file),
-                "stats": copy_stats.copy(),
-                "status": copy_status
-            })
-        
-        try:
-            results = self.core.copy_files(
-                destination,
-                organize_method=organize_method,
-                dry_run=dry_run,
-                progress_callback=progress_callback
-            )
-            
-            copy_stats = self.core.get_copy_stats()
-            
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "success",
-                            "dry_run": dry_run,
-                            "files_processed": len(results),
-                            "copy_stats": copy_stats,
-                            "sample_results": results[:10]  # First 10 results as sample
-                        }, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _get_copy_stats(self) -> Dict[str, Any]:
-        """Get copy statistics"""
-        try:
-            stats = self.core.get_copy_stats()
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(stats, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _add_exclusion(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Add folder to exclusion list"""
-        try:
-            folder_path = args["folder_path"]
-            self.core.add_excluded_folder(folder_path)
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "success",
-                            "message": f"Added exclusion: {folder_path}",
-                            "excluded_folders": [str(f) for f in sorted(self.core.excluded_folders)]
-                        }, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _remove_exclusion(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove folder from exclusion list"""
-        try:
-            folder_path = args["folder_path"]
-            self.core.remove_excluded_folder(folder_path)
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "success",
-                            "message": f"Removed exclusion: {folder_path}",
-                            "excluded_folders": [str(f) for f in sorted(self.core.excluded_folders)]
-                        }, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-    
-    def _clear_exclusions(self) -> Dict[str, Any]:
-        """Clear all exclusions"""
-        try:
-            self.core.clear_excluded_folders()
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "success",
-                            "message": "All exclusions cleared"
-                        }, indent=2)
-                    }
-                ]
-            }
-        except Exception as e:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "status": "error",
-                            "error": str(e)
-                        }, indent=2)
-                    }
-                ],
-                "isError": True
-            }
-
-
-def main():
-    """Main entry point for MCP server - communicates via stdio"""
-    server = PhotoPullerMCPServer()
-    
-    # Read from stdin, write to stdout
-    for line in sys.stdin:
-        try:
-            request = json.loads(line.strip())
-            response = server.handle_request(request)
-            print(json.dumps(response), flush=True)
-        except json.JSONDecodeError:
-            # Invalid JSON, skip
-            continue
-        except Exception as e:
-            # Send error response
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }
-            print(json.dumps(error_response), flush=True)
-
-
-if __name__ == "__main__":
-    main()
-
+"""
+PhotoPuller MCP Server
+Exposes PhotoPuller functionality to AI agents via Model Context Protocol
+"""
+import asyncio
+import json
+import sys
+import threading
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional
+from pathlib import Path
+from photopuller_core import PhotoPullerCore
+
+# orjson (C implementation) is markedly faster on the large sample_files /
+# sample_results payloads; fall back to stdlib json so the server still
+# runs with no external dependencies installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+    
+    _loads = json.loads
+
+
+# JSON-RPC error template for unknown methods/tools; copied per response
+_METHOD_NOT_FOUND = {"code": -32601, "message": ""}
+
+
+class RpcReq(NamedTuple):
+    """Parsed JSON-RPC request; attribute access beats repeated dict.get"""
+    method: str
+    params: Dict[str, Any]
+    id: Any
+    is_notification: bool
+
+# Tool schema is static; build it once at import instead of per tools/list
+_TOOLS_SCHEMA: Dict[str, Any] = {
+    "tools": [
+        {
+            "name": "photopuller_scan",
+            "description": "Scan a drive or directory for photos, videos, and PDFs",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "source_path": {
+                        "type": "string",
+                        "description": "Path to scan (e.g., 'C:\\' or 'D:\\Photos')"
+                    },
+                    "scan_photos": {
+                        "type": "boolean",
+                        "description": "Include photos in scan",
+                        "default": True
+                    },
+                    "scan_videos": {
+                        "type": "boolean",
+                        "description": "Include videos in scan",
+                        "default": True
+                    },
+                    "scan_pdfs": {
+                        "type": "boolean",
+                        "description": "Include PDFs in scan",
+                        "default": True
+                    },
+                    "excluded_folders": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of folder paths to exclude from scan",
+                        "default": []
+                    },
+                    "max_workers": {
+                        "type": "integer",
+                        "description": "Directory-scan worker threads (1 = serial)",
+                        "default": 4
+                    }
+                },
+                "required": ["source_path"]
+            }
+        },
+        {
+            "name": "photopuller_get_scan_stats",
+            "description": "Get statistics about the last scan operation",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "photopuller_copy_files",
+            "description": "Copy scanned files to a destination directory with organization",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "destination": {
+                        "type": "string",
+                        "description": "Destination directory path"
+                    },
+                    "organize_method": {
+                        "type": "string",
+                        "enum": ["date", "source"],
+                        "description": "Organization method: 'date' (Year/Month) or 'source' (by drive)",
+                        "default": "date"
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "If true, simulate copying without actually copying files",
+                        "default": False
+                    },
+                    "max_workers": {
+                        "type": "integer",
+                        "description": "Concurrent copies (1 = serial; keep 1 for a single HDD)",
+                        "default": 4
+                    }
+                },
+                "required": ["destination"]
+            }
+        },
+        {
+            "name": "photopuller_get_copy_stats",
+            "description": "Get statistics about the last copy operation",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "photopuller_add_exclusion",
+            "description": "Add a folder to the exclusion list",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "folder_path": {
+                        "type": "string",
+                        "description": "Path to folder to exclude"
+                    }
+                },
+                "required": ["folder_path"]
+            }
+        },
+        {
+            "name": "photopuller_remove_exclusion",
+            "description": "Remove a folder from the exclusion list",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "folder_path": {
+                        "type": "string",
+                        "description": "Path to folder to remove from exclusions"
+                    }
+                },
+                "required": ["folder_path"]
+            }
+        },
+        {
+            "name": "photopuller_clear_exclusions",
+            "description": "Clear all excluded folders",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    ]
+}
+
+
+class PhotoPullerMCPServer:
+    """MCP Server for PhotoPuller that exposes tools to AI agents"""
+    
+    def __init__(self):
+        # One core per client session, so concurrent sessions don't race on
+        # each other's scan results or exclusion lists
+        self.cores: Dict[str, PhotoPullerCore] = {}
+        # Serialized excluded-folders JSON per core, reused until mutation
+        self._excl_json_cache: Dict[int, tuple] = {}
+        # PhotoPullerCore is not thread-safe, and requests run
+        # concurrently in serve()'s executor; mutating tools take the
+        # core's lock so one core's state transitions stay serial while
+        # read-only tools and other sessions' cores proceed unblocked
+        self._core_locks: Dict[int, threading.Lock] = {}
+        self._cores_guard = threading.Lock()
+
+    def _get_core(self, session_id: Optional[str]) -> PhotoPullerCore:
+        """Get (lazily creating) the core for a session"""
+        key = session_id or "default"
+        core = self.cores.get(key)
+        if core is None:
+            with self._cores_guard:
+                core = self.cores.get(key)
+                if core is None:
+                    core = self.cores[key] = PhotoPullerCore()
+                    self._core_locks[id(core)] = threading.Lock()
+        return core
+    
+    def handle_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Handle an MCP request; returns None for notifications"""
+        req = RpcReq(request.get("method", ""),
+                     request.get("params") or {},
+                     request.get("id"),
+                     "id" not in request)
+        
+        if req.is_notification:
+            # JSON-RPC notification: execute for side effects but never
+            # respond, per spec
+            handler = self._METHODS.get(req.method)
+            if handler is not None:
+                try:
+                    handler(self, req.params)
+                except Exception:
+                    pass
+            return None
+        
+        handler = self._METHODS.get(req.method)
+        if handler is None:
+            error = _METHOD_NOT_FOUND.copy()
+            error["message"] = f"Method not found: {req.method}"
+            return {"jsonrpc": "2.0", "id": req.id, "error": error}
+        
+        try:
+            result = handler(self, req.params)
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": req.id,
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            }
+        
+        if result is None:
+            # call_tool signals an unknown tool without raising; per
+            # JSON-RPC that's method-not-found, not an internal error
+            error = _METHOD_NOT_FOUND.copy()
+            error["message"] = f"Unknown tool: {req.params.get('name')}"
+            return {"jsonrpc": "2.0", "id": req.id, "error": error}
+        
+        return {
+            "jsonrpc": "2.0",
+            "id": req.id,
+            "result": result
+        }
+    
+    def list_tools(self) -> Dict[str, Any]:
+        """List available MCP tools"""
+        return _TOOLS_SCHEMA
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any],
+                  core: PhotoPullerCore) -> Optional[Dict[str, Any]]:
+        """Call a specific tool with given arguments
+
+        Returns None for unknown tool names; handle_request turns that
+        into a -32601 error envelope.
+        """
+        handler = self._TOOLS.get(tool_name)
+        if handler is None:
+            return None
+        if tool_name in self._MUTATING_TOOLS:
+            # Serialize scan/copy/exclusion calls per core: e.g. a copy
+            # reading found_files while a concurrent scan rebuilds them
+            # would file data under the wrong paths
+            with self._core_locks[id(core)]:
+                return handler(self, core, arguments)
+        return handler(self, core, arguments)
+    
+    def _scan(self, core: PhotoPullerCore, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Scan for files"""
+        source_path = args["source_path"]
+        scan_photos = args.get("scan_photos", True)
+        scan_videos = args.get("scan_videos", True)
+        scan_pdfs = args.get("scan_pdfs", True)
+        excluded_folders = args.get("excluded_folders", [])
+        max_workers = args.get("max_workers", 4)
+        
+        try:
+            # No progress consumer on this transport; buffering per-path
+            # updates would just allocate O(files) dicts for the GC
+            found_files = core.scan(
+                source_path,
+                scan_photos=scan_photos,
+                scan_videos=scan_videos,
+                scan_pdfs=scan_pdfs,
+                excluded_folders=excluded_folders,
+                progress_callback=None,
+                max_workers=max_workers
+            )
+            
+            stats = core.get_scan_stats()
+            
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "success",
+                            "files_found": len(found_files),
+                            "stats": stats,
+                            "sample_files": found_files[:10]  # First 10 files as sample
+                        }, indent=True)
+                    }
+                ]
+            }
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _get_scan_stats(self, core: PhotoPullerCore) -> Dict[str, Any]:
+        """Get scan statistics"""
+        try:
+            stats = core.get_scan_stats()
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps(stats, indent=True)
+                    }
+                ]
+            }
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _copy_files(self, core: PhotoPullerCore, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy files to destination"""
+        destination = args["destination"]
+        organize_method = args.get("organize_method", "date")
+        dry_run = args.get("dry_run", False)
+        max_workers = args.get("max_workers", 4)
+        
+        try:
+            results = core.copy_files(
+                destination,
+                organize_method=organize_method,
+                dry_run=dry_run,
+                progress_callback=None,
+                max_workers=max_workers
+            )
+            
+            copy_stats = core.get_copy_stats()
+            
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "success",
+                            "dry_run": dry_run,
+                            "files_processed": len(results),
+                            "copy_stats": copy_stats,
+                            "sample_results": results[:10]  # First 10 results as sample
+                        }, indent=True)
+                    }
+                ]
+            }
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _get_copy_stats(self, core: PhotoPullerCore) -> Dict[str, Any]:
+        """Get copy statistics"""
+        try:
+            stats = core.get_copy_stats()
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps(stats, indent=True)
+                    }
+                ]
+            }
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _exclusion_response(self, core: PhotoPullerCore, message: str) -> Dict[str, Any]:
+        """Build an exclusion-tool response, reusing serialized JSON
+
+        The sorted folder list is already cached on the core; its JSON
+        text is cached here as well, so bulk add/remove scripts only pay
+        to serialize the one-line message per call.
+        """
+        folders = core.excluded_folders_str
+        cached = self._excl_json_cache.get(id(core))
+        if cached is None or cached[0] is not folders:
+            cached = (folders, _dumps(folders))
+            self._excl_json_cache[id(core)] = cached
+        text = ('{"status": "success", "message": %s, "excluded_folders": %s}'
+                % (_dumps(message), cached[1]))
+        return {"content": [{"type": "text", "text": text}]}
+    
+    def _add_exclusion(self, core: PhotoPullerCore, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Add folder to exclusion list"""
+        try:
+            folder_path = args["folder_path"]
+            core.add_excluded_folder(folder_path)
+            return self._exclusion_response(core, f"Added exclusion: {folder_path}")
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _remove_exclusion(self, core: PhotoPullerCore, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Remove folder from exclusion list"""
+        try:
+            folder_path = args["folder_path"]
+            core.remove_excluded_folder(folder_path)
+            return self._exclusion_response(core, f"Removed exclusion: {folder_path}")
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    def _clear_exclusions(self, core: PhotoPullerCore) -> Dict[str, Any]:
+        """Clear all exclusions"""
+        try:
+            core.clear_excluded_folders()
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "success",
+                            "message": "All exclusions cleared"
+                        }, indent=True)
+                    }
+                ]
+            }
+        except Exception as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _dumps({
+                            "status": "error",
+                            "error": str(e)
+                        }, indent=True)
+                    }
+                ],
+                "isError": True
+            }
+    
+    # Dispatch tables: one dict lookup instead of an if/elif chain per call.
+    # Defined after the handlers so the names are bound.
+    _METHODS = {
+        "tools/list": lambda self, params: self.list_tools(),
+        "tools/call": lambda self, params: self.call_tool(
+            params.get("name"), params.get("arguments", {}),
+            self._get_core(params.get("sessionId"))),
+    }
+    
+    # Tools that mutate core state and must hold the core's lock; the
+    # stats getters stay lock-free so they answer during a long scan/copy
+    _MUTATING_TOOLS = frozenset({
+        "photopuller_scan",
+        "photopuller_copy_files",
+        "photopuller_add_exclusion",
+        "photopuller_remove_exclusion",
+        "photopuller_clear_exclusions",
+    })
+
+    _TOOLS = {
+        "photopuller_scan": lambda self, core, args: self._scan(core, args),
+        "photopuller_get_scan_stats": lambda self, core, args: self._get_scan_stats(core),
+        "photopuller_copy_files": lambda self, core, args: self._copy_files(core, args),
+        "photopuller_get_copy_stats": lambda self, core, args: self._get_copy_stats(core),
+        "photopuller_add_exclusion": lambda self, core, args: self._add_exclusion(core, args),
+        "photopuller_remove_exclusion": lambda self, core, args: self._remove_exclusion(core, args),
+        "photopuller_clear_exclusions": lambda self, core, args: self._clear_exclusions(core),
+    }
+
+
+async def serve(server: PhotoPullerMCPServer):
+    """Read requests from stdin and dispatch each one as its own task
+
+    Long-running tools (a full drive scan or copy) run in the default
+    thread pool, so quick requests like tools/list or stats queries get
+    answered while a scan is still in flight instead of queueing behind it.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    # Responses are queued as encoded lines and drained by one writer
+    # coroutine, so a burst of completions costs one write+flush per
+    # batch instead of one per response
+    pending_writes = deque()
+    writable = asyncio.Event()
+    pending = set()
+
+    async def writer():
+        out = sys.stdout.buffer
+        while True:
+            await writable.wait()
+            writable.clear()
+            batch = []
+            size = 0
+            # Bound the batch so a client doing blocking reads is never
+            # starved waiting for one giant write
+            while pending_writes and size < 65536:
+                chunk = pending_writes.popleft()
+                batch.append(chunk)
+                size += len(chunk)
+            if batch:
+                out.write(b"".join(batch))
+                out.flush()
+            if pending_writes:
+                writable.set()
+
+    writer_task = asyncio.create_task(writer())
+
+    async def handle_and_write(line: bytes):
+        try:
+            request = _loads(line)
+        except ValueError:
+            # Invalid JSON, skip
+            return
+        try:
+            response = await loop.run_in_executor(None, server.handle_request, request)
+        except Exception as e:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            }
+        if response is None:
+            # Notification: nothing goes back on the wire
+            return
+        pending_writes.append(_dumps(response).encode() + b"\n")
+        writable.set()
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        task = asyncio.create_task(handle_and_write(line))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    # Finish any requests still running when stdin closes, then let the
+    # writer drain whatever they queued before stopping it
+    if pending:
+        await asyncio.gather(*pending)
+    while pending_writes:
+        await asyncio.sleep(0)
+    writer_task.cancel()
+
+
+def main():
+    """Main entry point for MCP server - communicates via stdio"""
+    server = PhotoPullerMCPServer()
+    asyncio.run(serve(server))
+
+
+if __name__ == "__main__":
+    main()
+
@@ -4,9 +4,30 @@ PhotoPuller CLI - Command-line interface for headless operation
 import argparse
 import sys
 import json
-from pathlib import Path
+import time
 from photopuller_core import PhotoPullerCore
 
+# orjson serializes several times faster than the stdlib; fall back
+# silently since requirements.txt promises a no-dependency install
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Progress lines as prebuilt byte templates: %-formatting into bytes and
+# writing straight to the stdout buffer skips the f-string machinery and
+# the text-layer encode on every update
+_SCAN_TMPL = b"\rScanning: %-63s | Found: %d photos, %d videos, %d PDFs"
+_COPY_TMPL = b"\rCopying: %-53s | Copied: %d, Skipped: %d, Errors: %d"
+
+
+def _dump_json(obj) -> str:
+    """Serialize one object compactly with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
 
 def main():
     """Main CLI entry point"""
@@ -69,13 +90,22 @@ Examples:
     # Initialize core
     core = PhotoPullerCore()
     
-    # Progress callback
+    # Progress callbacks fire once per directory/file; rendering and
+    # flushing a line each time dominates large runs, so throttle the
+    # terminal updates to ~20 Hz
+    last_emit = [0.0]
+
     def progress_callback(current_path, stats):
-        if not args.quiet:
-            pdfs = stats.get('pdfs_found', 0)
-            print(f"\rScanning: {current_path[:60]}... | "
-                  f"Found: {stats['photos_found']} photos, {stats['videos_found']} videos, {pdfs} PDFs", 
-                  end='', flush=True)
+        if args.quiet:
+            return
+        now = time.monotonic()
+        if now - last_emit[0] < 0.05:
+            return
+        last_emit[0] = now
+        out = sys.stdout.buffer
+        out.write(_SCAN_TMPL % ((current_path[:60] + '...').encode('utf-8', 'replace'),
+                                stats.photos_found, stats.videos_found, stats.pdfs_found))
+        out.flush()
     
     try:
         # Scan
@@ -130,17 +160,38 @@ Examples:
             print(f"\n{mode}Copying files to: {args.destination}")
             print(f"Organization method: {args.organize_by}")
         
-        def copy_progress(current_file, copy_stats):
-            if not args.quiet:
-                print(f"\rCopying: {Path(current_file).name[:50]}... | "
-                      f"Copied: {copy_stats['copied']}, Skipped: {copy_stats['skipped']}, "
-                      f"Errors: {copy_stats['errors']}", end='', flush=True)
+        def copy_progress(current_file, copy_stats, copy_status=None):
+            if args.quiet:
+                return
+            # Always show errors; everything else is throttled
+            now = time.monotonic()
+            if copy_status != 'error' and now - last_emit[0] < 0.05:
+                return
+            last_emit[0] = now
+            out = sys.stdout.buffer
+            name = current_file.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+            out.write(_COPY_TMPL % ((name[:50] + '...').encode('utf-8', 'replace'),
+                                    copy_stats.copied, copy_stats.skipped,
+                                    copy_stats.errors))
+            out.flush()
         
-        results = core.copy_files(
+        # Stream results through a sink so the full list is only kept in
+        # memory when the JSON report actually needs it
+        results = [] if args.json else None
+        result_count = 0
+
+        def result_sink(result):
+            nonlocal result_count
+            result_count += 1
+            if results is not None:
+                results.append(result)
+
+        core.copy_files(
             args.destination,
             organize_method=args.organize_by,
             dry_run=args.dry_run,
-            progress_callback=copy_progress
+            progress_callback=copy_progress,
+            result_sink=result_sink
         )
         
         if not args.quiet:
@@ -150,25 +201,27 @@ Examples:
         copy_stats = core.get_copy_stats()
         
         if args.json:
-            # Output JSON
-            output = {
-                'scan': stats,
-                'copy': copy_stats if not args.dry_run else {'dry_run': True},
-                'files': [
-                    {
-                        'source': str(f),
-                        'destination': r.get('destination', ''),
-                        'status': r.get('status', '')
-                    }
-                    for f, r in zip(found_files, results)
-                ]
-            }
-            print(json.dumps(output, indent=2))
+            # Stream the JSON report one record at a time instead of
+            # building the whole document (and a second list of per-file
+            # dicts) in memory first
+            out = sys.stdout
+            out.write('{"scan": %s, "copy": %s, "files": [' % (
+                _dump_json(stats),
+                _dump_json(copy_stats if not args.dry_run else {'dry_run': True})))
+            for idx, (f, r) in enumerate(zip(found_files, results)):
+                if idx:
+                    out.write(', ')
+                out.write(_dump_json({
+                    'source': f,
+                    'destination': r.get('destination', ''),
+                    'status': r.get('status', '')
+                }))
+            out.write(']}\n')
         else:
             # Output summary
             if not args.quiet:
                 if args.dry_run:
-                    print(f"\nDry run complete! Would copy {len(results)} files.")
+                    print(f"\nDry run complete! Would copy {result_count} files.")
                 else:
                     print(f"\nCopy Results:")
                     print(f"  Copied: {copy_stats.get('copied', 0)}")
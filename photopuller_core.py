@@ -2,10 +2,10 @@
 PhotoPuller Core - Business logic for scanning and organizing files
 Can be used with or without GUI
 """
-from pathlib import Path
+import os
 from typing import List, Set, Optional, Callable
-from scanner import FileScanner
-from organizer import FileOrganizer
+from scanner import FileScanner, FileInfo
+from organizer import FileOrganizer, CopyProgress
 
 
 class PhotoPullerCore:
@@ -14,21 +14,25 @@ class PhotoPullerCore:
     def __init__(self):
         self.scanner = FileScanner()
         self.organizer = None
-        self.found_files = []
-        self.file_infos = []
         self.excluded_folders = set()
-        self.all_found_files = []
-        self.all_file_infos = []
+        self._excluded_str_cache = None
+        # Single source of truth for scan results: [path, info, excluded]
+        # triples. The found_files/file_infos views are carved out lazily,
+        # so exclusions flip a flag instead of copying whole lists around
+        self._records = []
+        self._files_cache = None
+        self._infos_cache = None
     
     def scan(self, source_path: str, 
              scan_photos: bool = True,
              scan_videos: bool = True,
              scan_pdfs: bool = True,
              excluded_folders: Optional[List[str]] = None,
-             progress_callback: Optional[Callable] = None) -> List[Path]:
+             progress_callback: Optional[Callable] = None,
+             max_workers: int = 1) -> List[str]:
         """
         Scan for files
-        
+
         Args:
             source_path: Path to scan
             scan_photos: Include photos in scan
@@ -36,98 +40,174 @@ class PhotoPullerCore:
             scan_pdfs: Include PDFs in scan
             excluded_folders: List of folder paths to exclude
             progress_callback: Optional callback(current_path, stats)
-        
+            max_workers: Directory-scan worker threads (1 = serial)
+
         Returns:
-            List of found file paths
+            List of found file paths (strings)
         """
         # Validate at least one type is selected
         if not scan_photos and not scan_videos and not scan_pdfs:
             raise ValueError("At least one file type must be selected (photos, videos, or PDFs)")
         
-        # Set excluded folders
+        # Set excluded folders; paths stay plain strings end to end, so
+        # normalize once here instead of round-tripping through Path
         if excluded_folders:
-            self.excluded_folders = {Path(f) for f in excluded_folders}
+            self.excluded_folders = {os.path.normpath(f) for f in excluded_folders}
         else:
             self.excluded_folders = set()
+        self._excluded_str_cache = None
         
-        # Scan for files
-        self.found_files = self.scanner.scan_drive(source_path, progress_callback)
-        
-        # Filter by file type
-        filtered_files = []
-        for file_path in self.found_files:
-            is_photo = self.scanner.is_photo(file_path)
-            is_video = self.scanner.is_video(file_path)
-            is_pdf = self.scanner.is_pdf(file_path)
-            
-            if (scan_photos and is_photo) or (scan_videos and is_video) or (scan_pdfs and is_pdf):
-                filtered_files.append(file_path)
-        
-        self.found_files = filtered_files
-        
-        # Get file info for each file
-        self.file_infos = []
-        for file_path in self.found_files:
-            info = self.scanner.get_file_info(file_path)
-            self.file_infos.append(info)
-        
+        # Fold the type filter into the walk: one frozenset lookup per file
+        # instead of a post-scan pass with three suffix checks each
+        allowed_exts = frozenset().union(
+            self.scanner.PHOTO_EXTENSIONS if scan_photos else (),
+            self.scanner.VIDEO_EXTENSIONS if scan_videos else (),
+            self.scanner.PDF_EXTENSIONS if scan_pdfs else ()
+        )
+
+        # Scan for files; hand the exclusions to the scanner so excluded
+        # subtrees are pruned during the walk instead of filtered afterwards
+        # Trailing separator gives whole-component matching, the same
+        # semantics as the _apply_exclusions trie: excluding /a/other must
+        # not also prune the sibling /a/otherworld
+        excluded_prefixes = tuple(f.lower().rstrip(os.sep) + os.sep
+                                  for f in self.excluded_folders)
+        scanned = self.scanner.scan_drive(source_path, progress_callback,
+                                          max_workers=max_workers,
+                                          excluded_prefixes=excluded_prefixes,
+                                          allowed_exts=allowed_exts)
+
+        # Get file info for each file; cache the display strings here so the
+        # GUI doesn't re-format size/date per row on every repopulation
+        # (isoformat is also considerably faster than strftime)
+        self._records = []
+        for file_path, st in zip(scanned, self.scanner.found_stats):
+            info = self.scanner.get_file_info(file_path, st)
+            if info.error is None:
+                info.size_str = f"{info.size / 1048576:.2f} MB"
+                info.date_str = info.modified.isoformat(sep=' ', timespec='minutes')
+            self._records.append([file_path, info, False])
+
         # Apply exclusions
         self._apply_exclusions()
-        
-        # Store original results
-        self.all_found_files = self.found_files.copy()
-        self.all_file_infos = self.file_infos.copy()
-        
+
         return self.found_files
     
+    @property
+    def found_files(self) -> List[str]:
+        """Paths from the last scan that aren't under an excluded folder"""
+        if self._files_cache is None:
+            self._files_cache = [r[0] for r in self._records if not r[2]]
+        return self._files_cache
+
+    @property
+    def file_infos(self) -> List[FileInfo]:
+        """FileInfo records matching found_files, index for index"""
+        if self._infos_cache is None:
+            self._infos_cache = [r[1] for r in self._records if not r[2]]
+        return self._infos_cache
+
+    @property
+    def all_found_files(self) -> List[str]:
+        """All scanned paths, including ones under excluded folders"""
+        return [r[0] for r in self._records]
+
+    @property
+    def all_file_infos(self) -> List[FileInfo]:
+        """FileInfo records for every scanned path, excluded or not"""
+        return [r[1] for r in self._records]
+
+    @property
+    def has_files(self) -> bool:
+        """Whether the last scan produced any (non-excluded) files"""
+        return bool(self.found_files)
+
+    @property
+    def excluded_folders_str(self) -> List[str]:
+        """Excluded folders as a sorted list of strings
+
+        Cached until the exclusion set changes, so callers that echo the
+        list after every mutation don't re-sort and re-stringify each time.
+        """
+        if self._excluded_str_cache is None:
+            self._excluded_str_cache = sorted(self.excluded_folders)
+        return self._excluded_str_cache
+
+    def _build_exclusion_trie(self) -> dict:
+        """Build a trie of lowercased path components from the exclusions
+
+        A None key marks the end of an excluded folder. Matching a file
+        walks its components through the trie, so the cost per file is
+        O(path depth) regardless of how many folders are excluded.
+        """
+        trie = {}
+        for folder in self.excluded_folders:
+            node = trie
+            for part in folder.lower().split(os.sep):
+                if part:
+                    node = node.setdefault(part, {})
+            node[None] = True
+        return trie
+
     def _apply_exclusions(self):
-        """Filter results based on excluded folders"""
+        """Re-flag records against the current excluded folders
+
+        Flips the excluded flag in place rather than rebuilding filtered
+        copies of the path and info lists; the cached views are
+        invalidated and carved out again on next access. Removing an
+        exclusion therefore also brings its files back.
+        """
+        self._files_cache = None
+        self._infos_cache = None
+
         if not self.excluded_folders:
+            for record in self._records:
+                record[2] = False
             return
-        
-        filtered_files = []
-        filtered_infos = []
-        
-        for file_path, file_info in zip(self.found_files, self.file_infos):
-            file_path_str = str(file_path)
-            is_excluded = False
-            
-            for excluded_folder in self.excluded_folders:
-                excluded_folder_str = str(excluded_folder)
-                if file_path_str.lower().startswith(excluded_folder_str.lower()):
-                    is_excluded = True
+
+        trie = self._build_exclusion_trie()
+        sep = os.sep
+
+        for record in self._records:
+            node = trie
+            excluded = False
+            for part in record[0].lower().split(sep):
+                if not part:
+                    continue
+                node = node.get(part)
+                if node is None:
                     break
-            
-            if not is_excluded:
-                filtered_files.append(file_path)
-                filtered_infos.append(file_info)
-        
-        self.found_files = filtered_files
-        self.file_infos = filtered_infos
+                if None in node:
+                    excluded = True
+                    break
+            record[2] = excluded
     
     def add_excluded_folder(self, folder_path: str):
         """Add a folder to the exclusion list"""
-        self.excluded_folders.add(Path(folder_path))
+        self.excluded_folders.add(os.path.normpath(folder_path))
+        self._excluded_str_cache = None
         self._apply_exclusions()
-    
+
     def remove_excluded_folder(self, folder_path: str):
         """Remove a folder from the exclusion list"""
-        folder = Path(folder_path)
+        folder = os.path.normpath(folder_path)
         if folder in self.excluded_folders:
             self.excluded_folders.remove(folder)
+            self._excluded_str_cache = None
             self._apply_exclusions()
-    
+
     def clear_excluded_folders(self):
         """Clear all excluded folders"""
         self.excluded_folders.clear()
+        self._excluded_str_cache = None
         self._apply_exclusions()
     
     def get_scan_stats(self) -> dict:
         """Get statistics about the scan"""
-        total_size = sum(info.get('size', 0) for info in self.file_infos if 'error' not in info)
-        photos_count = sum(1 for info in self.file_infos if info.get('is_photo', False) and 'error' not in info)
-        videos_count = sum(1 for info in self.file_infos if info.get('is_video', False) and 'error' not in info)
-        pdfs_count = sum(1 for info in self.file_infos if info.get('is_pdf', False) and 'error' not in info)
+        total_size = sum(info.size for info in self.file_infos if info.error is None)
+        photos_count = sum(1 for info in self.file_infos if info.error is None and info.is_photo)
+        videos_count = sum(1 for info in self.file_infos if info.error is None and info.is_video)
+        pdfs_count = sum(1 for info in self.file_infos if info.error is None and info.is_pdf)
         
         return {
             'total_files': len(self.found_files),
@@ -136,26 +216,33 @@ class PhotoPullerCore:
             'pdfs': pdfs_count,
             'total_size_bytes': total_size,
             'total_size_gb': total_size / (1024 * 1024 * 1024),
-            'excluded_count': len(self.all_found_files) - len(self.found_files)
+            'excluded_count': len(self._records) - len(self.found_files)
         }
     
     def copy_files(self, destination: str,
                    organize_method: str = 'date',
                    dry_run: bool = False,
                    progress_callback: Optional[Callable] = None,
-                   file_progress_callback: Optional[Callable] = None) -> List[dict]:
+                   file_progress_callback: Optional[Callable] = None,
+                   max_workers: int = 1,
+                   result_sink: Optional[Callable] = None) -> List[dict]:
         """
         Copy files to destination
-        
+
         Args:
             destination: Destination directory path
             organize_method: 'date' or 'source'
             dry_run: If True, don't actually copy files, just report what would be copied
             progress_callback: Optional callback(current_file, stats, copy_status=None)
             file_progress_callback: Optional callback(bytes_copied, total_bytes, copy_rate_mbps)
-        
+            max_workers: Concurrent copies (1 = serial)
+            result_sink: Optional callback(result_dict) invoked per file as
+                copies finish. When set, results stream to the sink and the
+                return value is an empty list, so memory stays flat on very
+                large pulls; when unset, the full result list is returned
+
         Returns:
-            List of copy result dictionaries
+            List of copy result dictionaries (empty when result_sink is set)
         """
         if not self.found_files:
             raise ValueError("No files to copy. Run scan() first.")
@@ -165,8 +252,9 @@ class PhotoPullerCore:
             # Create a temporary organizer to determine destination paths
             temp_organizer = FileOrganizer(destination)
             results = []
+            count = 0
             for file_path, file_info in zip(self.found_files, self.file_infos):
-                if 'error' in file_info:
+                if file_info.error is not None:
                     continue
                 
                 # Determine where file would be copied
@@ -175,24 +263,29 @@ class PhotoPullerCore:
                 else:
                     dest_path = temp_organizer.organize_by_source(file_path, file_info)
                 
-                results.append({
+                result = {
                     'status': 'would_copy',
-                    'source': str(file_path),
+                    'source': file_path,
                     'destination': str(dest_path),
-                    'size': file_info.get('size', 0)
-                })
-                
+                    'size': file_info.size
+                }
+                if result_sink is not None:
+                    count += 1
+                    result_sink(result)
+                else:
+                    results.append(result)
+
                 if progress_callback:
                     # Simulate progress
-                    stats = {
-                        'total': len(self.found_files),
-                        'copied': len(results),
-                        'skipped': 0,
-                        'errors': 0,
-                        'duplicates': 0
-                    }
-                    progress_callback(str(file_path), stats, 'would_copy')
-            
+                    stats = CopyProgress(
+                        total=len(self.found_files),
+                        copied=count if result_sink is not None else len(results),
+                        skipped=0,
+                        errors=0,
+                        duplicates=0
+                    )
+                    progress_callback(file_path, stats, 'would_copy')
+
             return results
         
         # Normal copy mode
@@ -200,15 +293,22 @@ class PhotoPullerCore:
         
         # The organizer's copy_file method already calls progress_callback with (current_file, stats, copy_status)
         # So we can pass it directly
-        results = self.organizer.copy_files(
+        result_iter = self.organizer.iter_copy_files(
             self.found_files,
             self.file_infos,
             organize_method,
             progress_callback,
-            file_progress_callback
+            file_progress_callback,
+            max_workers=max_workers
         )
-        
-        return results
+
+        if result_sink is not None:
+            # Stream results out instead of accumulating them
+            for result in result_iter:
+                result_sink(result)
+            return []
+
+        return list(result_iter)
     
     def get_copy_stats(self) -> dict:
         """Get statistics about the copy operation"""
@@ -2,10 +2,87 @@
 File scanner module - finds photos and videos on a drive
 """
 import os
-from pathlib import Path
-from typing import List, Set
+import re
+import stat as stat_module
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Set
 from datetime import datetime
 
+import _statx
+
+
+class FileInfo:
+    """Per-file record produced by get_file_info
+
+    A fixed-slot class instead of a dict: a scan can hold hundreds of
+    thousands of these at once, and eight-key dicts cost several times
+    the memory of a slotted record. kind carries the classification
+    decided at scan time ('Photos', 'Videos', 'PDFs' or 'Media', which
+    is also the destination subfolder name); the is_* and type_str
+    views derive from it so nothing downstream re-tests extensions.
+    size_str and date_str start empty and are filled in by the core
+    with cached display strings. error is None for good records and the
+    failure message for paths that could not be statted.
+    """
+    __slots__ = ('path', 'name', 'size', 'modified', 'created', 'kind',
+                 'size_str', 'date_str', 'error')
+
+    _TYPE_STR = {'Photos': 'Photo', 'Videos': 'Video', 'PDFs': 'PDF'}
+
+    def __init__(self, path: str, name: str = '', size=None,
+                 modified=None, created=None, kind: str = 'Media',
+                 error=None):
+        self.path = path
+        self.name = name
+        self.size = size
+        self.modified = modified
+        self.created = created
+        self.kind = kind
+        self.size_str = ''
+        self.date_str = ''
+        self.error = error
+
+    @property
+    def is_photo(self) -> bool:
+        return self.kind == 'Photos'
+
+    @property
+    def is_video(self) -> bool:
+        return self.kind == 'Videos'
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.kind == 'PDFs'
+
+    @property
+    def type_str(self) -> str:
+        return self._TYPE_STR.get(self.kind, 'Unknown')
+
+    def __repr__(self):
+        return f"FileInfo(path={self.path!r}, kind={self.kind!r})"
+
+
+def _ext(name: str) -> str:
+    """Lowercased extension of a raw name, '' when there is none
+
+    One rfind plus a slice; os.path.splitext pays for flavour handling
+    this hot path doesn't need.
+    """
+    i = name.rfind('.')
+    return name[i:].lower() if i >= 0 else ''
+
+
+class ScanProgress(NamedTuple):
+    """Immutable snapshot of the scan counters passed to progress callbacks"""
+    total_scanned: int
+    photos_found: int
+    videos_found: int
+    pdfs_found: int
+    excluded: int
+
+
 class FileScanner:
     """Scans drives for photo and video files"""
     
@@ -20,21 +97,50 @@ class FileScanner:
     
     # PDF extensions
     PDF_EXTENSIONS = {'.pdf'}
+
+    # All media extensions combined, for the raw-name check in the scan loop
+    MEDIA_EXTENSIONS = PHOTO_EXTENSIONS | VIDEO_EXTENSIONS | PDF_EXTENSIONS
+
+    # Extension -> scan_stats counter key, so classifying a kept file is
+    # one dict lookup instead of chained set membership tests
+    EXT_KIND = {
+        **{e: 'photos_found' for e in PHOTO_EXTENSIONS},
+        **{e: 'videos_found' for e in VIDEO_EXTENSIONS},
+        **{e: 'pdfs_found' for e in PDF_EXTENSIONS},
+    }
     
-    # Paths to exclude (system files, program files, temp files)
-    EXCLUDED_PATHS = {
+    # Paths to exclude (system files, program files, temp files).
+    # Exact directory names go in the frozenset — one hash lookup per
+    # path component — and only the few patterns that genuinely appear
+    # embedded in longer names keep the substring scan.
+    EXCLUDED_EXACT = frozenset({
         'windows', 'program files', 'program files (x86)', 'programdata',
-        'appdata', 'temp', 'tmp', '$recycle.bin', 'system volume information',
+        'appdata', '$recycle.bin', 'system volume information',
         'pagefile.sys', 'hiberfil.sys', 'swapfile.sys', 'recovery',
         'perflogs', 'msocache', 'intel', 'amd', 'nvidia',
         'internet explorer', 'microsoft edge', 'chrome', 'firefox',
-        'opera', 'safari', 'cache', 'cookies', 'history',
+        'opera', 'safari', 'cookies', 'history',
         'temporary internet files', 'content.ie5', 'local settings',
-        'application data', 'roaming', 'local', 'temp', 'tmp', 'node_modules'
-    }
+        'application data', 'roaming', 'local', 'node_modules'
+    })
+    EXCLUDED_SUBSTR = ('cache', 'temp', 'tmp')
+    # The substring patterns contain no separator, so one search over the
+    # whole lowercased path is equivalent to testing every component
+    _EXCL_SUBSTR_RE = re.compile('|'.join(map(re.escape, EXCLUDED_SUBSTR)))
+
+    # Folders that are clearly user media trees; the <1KB thumbnail
+    # filter is skipped inside them, both because a camera's tiny shots
+    # are still wanted and because it saves the size lookup per file
+    USER_MEDIA_ROOTS = frozenset({
+        'pictures', 'dcim', 'camera', 'camera roll',
+        'videos', 'photos', 'downloads'
+    })
     
     def __init__(self):
-        self.found_files: List[Path] = []
+        self.found_files: List[str] = []
+        # Stat results captured during the walk, index for index with
+        # found_files, so get_file_info doesn't stat everything again
+        self.found_stats: List = []
         self.scan_stats = {
             'total_scanned': 0,
             'photos_found': 0,
@@ -43,37 +149,46 @@ class FileScanner:
             'excluded': 0
         }
     
-    def is_photo(self, file_path: Path) -> bool:
+    def is_photo(self, file_path: str) -> bool:
         """Check if file is a photo"""
-        return file_path.suffix.lower() in self.PHOTO_EXTENSIONS
-    
-    def is_video(self, file_path: Path) -> bool:
+        return _ext(file_path) in self.PHOTO_EXTENSIONS
+
+    def is_video(self, file_path: str) -> bool:
         """Check if file is a video"""
-        return file_path.suffix.lower() in self.VIDEO_EXTENSIONS
-    
-    def is_pdf(self, file_path: Path) -> bool:
+        return _ext(file_path) in self.VIDEO_EXTENSIONS
+
+    def is_pdf(self, file_path: str) -> bool:
         """Check if file is a PDF"""
-        return file_path.suffix.lower() in self.PDF_EXTENSIONS
-    
-    def is_media_file(self, file_path: Path) -> bool:
+        return _ext(file_path) in self.PDF_EXTENSIONS
+
+    def is_media_file(self, file_path: str) -> bool:
         """Check if file is a photo, video, or PDF"""
-        return self.is_photo(file_path) or self.is_video(file_path) or self.is_pdf(file_path)
-    
-    def should_exclude_path(self, file_path: Path) -> bool:
+        return _ext(file_path) in self.MEDIA_EXTENSIONS
+
+    def should_exclude_path(self, file_path: str, st=None) -> bool:
         """
         Determine if a path should be excluded based on common system/program locations
+
+        st may carry an os.stat_result already fetched for the path (e.g.
+        a DirEntry's cached stat), sparing the size check its syscalls.
         """
-        path_str = str(file_path).lower()
+        path_str = file_path.lower()
         path_parts = path_str.split(os.sep)
         
+        # One compiled search covers all substring patterns at once
+        if self._EXCL_SUBSTR_RE.search(path_str):
+            return True
+
         # Check each part of the path
         for part in path_parts:
-            # Exclude if any part matches excluded patterns
-            if any(excluded in part.lower() for excluded in self.EXCLUDED_PATHS):
+            # Exact names are one hash lookup
+            if part in self.EXCLUDED_EXACT:
                 return True
-            
-            # Exclude hidden/system directories
-            if part.startswith('.') and part != '.':
+
+            # Exclude hidden/system directories; the index test is one
+            # comparison versus a method call plus an equality check
+            # (empty parts from doubled separators fail the length guard)
+            if len(part) > 1 and part[0] == '.':
                 return True
         
         # Additional checks for common patterns
@@ -83,28 +198,77 @@ class FileScanner:
         
         # Exclude very small files (likely thumbnails or icons)
         # Only check size for files, not directories
-        if file_path.is_file():
+        if st is not None:
+            # Caller passed the cached stat from the directory listing;
+            # no extra syscalls needed
+            if st.st_size < 1024:  # Less than 1KB
+                return True
+        elif _statx.HAS_STATX:
+            # One partial statx answers both "is it a file" and the size,
+            # instead of an isfile plus a full stat
+            r = _statx.statx(file_path)
+            if r is not None and stat_module.S_ISREG(r.st_mode) and r.st_size < 1024:
+                return True
+        elif os.path.isfile(file_path):
             try:
-                if file_path.stat().st_size < 1024:  # Less than 1KB
+                if os.stat(file_path).st_size < 1024:  # Less than 1KB
                     return True
             except (OSError, PermissionError):
                 # If we can't check the size, don't exclude - let it through
                 pass
-        
+
         return False
     
-    def scan_drive(self, drive_path: str, progress_callback=None) -> List[Path]:
+    def _is_media_root_path(self, path: str) -> bool:
+        """Whether any component of path is a known user media folder"""
+        return any(part in self.USER_MEDIA_ROOTS
+                   for part in path.lower().split(os.sep))
+
+    def _should_exclude_file(self, name_lower: str, st) -> bool:
+        """Exclusion check for a file whose directory is already vetted
+
+        The walkers validate every directory before descending into it,
+        so per file only the name itself and the size need testing.
+        """
+        if name_lower in self.EXCLUDED_EXACT:
+            return True
+        if self._EXCL_SUBSTR_RE.search(name_lower):
+            return True
+        # Hidden files and thumbnail caches (scandir names are never
+        # empty, so the bare index is safe)
+        if name_lower[0] == '.':
+            return True
+        if name_lower in ('thumbs.db', 'ehthumbs.db'):
+            return True
+        # Very small files are likely thumbnails or icons
+        if st is not None and st.st_size < 1024:
+            return True
+        return False
+
+    def scan_drive(self, drive_path: str, progress_callback=None,
+                   max_workers: int = 1,
+                   excluded_prefixes: tuple = (),
+                   allowed_exts=None) -> List[str]:
         """
         Scan a drive for photos and videos
-        
+
         Args:
             drive_path: Path to the drive to scan (e.g., 'C:\\' or 'D:\\')
             progress_callback: Optional callback function(current_path, stats)
-        
+            max_workers: Directory-listing threads; >1 overlaps metadata
+                I/O, which helps on SSDs and network shares
+            excluded_prefixes: Lowercased, separator-terminated
+                user-excluded folder paths; the folder and anything under
+                it are pruned without being listed at all
+            allowed_exts: Extensions to accept; defaults to all media
+                extensions. Lets callers fold their type filters into the
+                walk instead of re-filtering the results
+
         Returns:
-            List of Path objects for found media files
+            List of path strings for found media files
         """
         self.found_files = []
+        self.found_stats = []
         self.scan_stats = {
             'total_scanned': 0,
             'photos_found': 0,
@@ -112,61 +276,291 @@ class FileScanner:
             'pdfs_found': 0,
             'excluded': 0
         }
-        
-        drive = Path(drive_path)
-        if not drive.exists():
+
+        if not os.path.exists(drive_path):
             raise ValueError(f"Drive path does not exist: {drive_path}")
-        
-        # Scan recursively
+
+        if max_workers and max_workers > 1:
+            self._scan_parallel(drive_path, progress_callback, max_workers,
+                                excluded_prefixes, allowed_exts)
+            return self.found_files
+
+        self.found_files = list(self.iter_drive(drive_path, progress_callback,
+                                                excluded_prefixes, allowed_exts))
+        return self.found_files
+
+    def iter_drive(self, drive_path: str, progress_callback=None,
+                   excluded_prefixes: tuple = (),
+                   allowed_exts=None):
+        """
+        Scan a drive serially, yielding each kept file as it is found
+
+        Streaming counterpart of scan_drive: consumers that can process
+        files one at a time (hash, copy) never hold the whole result list
+        in memory. found_stats and scan_stats are reset on entry and fill
+        in as the walk progresses, staying index-aligned with the yields,
+        so found_stats[i] is the cached stat of the i-th yielded path.
+
+        Args:
+            drive_path: Path to the drive to scan
+            progress_callback: Optional callback function(current_path, stats)
+            excluded_prefixes: Lowercased, separator-terminated
+                user-excluded folder paths
+            allowed_exts: Extensions to accept; defaults to all media
+
+        Yields:
+            Path strings for found media files, in discovery order
+        """
+        self.found_stats = []
+        self.scan_stats = {
+            'total_scanned': 0,
+            'photos_found': 0,
+            'videos_found': 0,
+            'pdfs_found': 0,
+            'excluded': 0
+        }
+
+        if not os.path.exists(drive_path):
+            raise ValueError(f"Drive path does not exist: {drive_path}")
+
+        # Walk with os.scandir and an explicit stack instead of os.walk:
+        # DirEntry carries the readdir d_type and a cached stat, so file
+        # type and size come for free instead of one extra syscall each
         try:
-            for root, dirs, files in os.walk(drive_path):
-                # Update progress
+            media_exts = allowed_exts if allowed_exts is not None else self.MEDIA_EXTENSIONS
+            ext_kind = self.EXT_KIND
+            stats = self.scan_stats
+
+            stack = [(drive_path, self._is_media_root_path(drive_path))]
+            last_progress = 0.0
+            # (device, inode) of every directory entered so far; junctions
+            # and bind mounts can loop a subtree back into an ancestor, and
+            # without this the walk would recurse until the path overflows
+            visited = set()
+            try:
+                root_st = os.lstat(drive_path)
+                visited.add((root_st.st_dev, root_st.st_ino))
+            except OSError:
+                pass
+            while stack:
+                root, in_media_root = stack.pop()
+                # Update progress at most ~20 times a second; snapshotting
+                # the counters and calling back into a GUI per directory
+                # is the dominant Python overhead on deep trees
                 if progress_callback:
-                    progress_callback(root, self.scan_stats)
-                
-                # Filter out excluded directories to avoid traversing them
-                dirs[:] = [d for d in dirs if not self.should_exclude_path(Path(root) / d)]
-                
-                for file in files:
-                    self.scan_stats['total_scanned'] += 1
-                    file_path = Path(root) / file
-                    
-                    # Check if it's a media file
-                    if self.is_media_file(file_path):
-                        # Check if it should be excluded
-                        if not self.should_exclude_path(file_path):
-                            self.found_files.append(file_path)
-                            if self.is_photo(file_path):
-                                self.scan_stats['photos_found'] += 1
-                            elif self.is_video(file_path):
-                                self.scan_stats['videos_found'] += 1
-                            elif self.is_pdf(file_path):
-                                self.scan_stats['pdfs_found'] += 1
-                        else:
-                            self.scan_stats['excluded'] += 1
-                            
-        except PermissionError as e:
-            # Some directories may be inaccessible, continue scanning
-            print(f"Permission denied: {e}")
+                    now = time.monotonic()
+                    if now - last_progress >= 0.05:
+                        last_progress = now
+                        progress_callback(root, ScanProgress(**stats))
+
+                try:
+                    with os.scandir(root) as it:
+                        entries = list(it)
+                except (OSError, PermissionError):
+                    continue
+
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune excluded directories (system locations
+                            # and user-excluded subtrees) without entering
+                            dir_path = entry.path
+                            if self.should_exclude_path(dir_path):
+                                continue
+                            # Separator-terminated comparison so a prefix
+                            # only matches whole path components
+                            if excluded_prefixes and \
+                                    (dir_path.lower() + os.sep).startswith(excluded_prefixes):
+                                continue
+                            # One lstat per directory for cycle detection;
+                            # an inode of 0 means the filesystem doesn't
+                            # report one, so don't track those
+                            try:
+                                dir_st = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+                            if dir_st.st_ino:
+                                dev_ino = (dir_st.st_dev, dir_st.st_ino)
+                                if dev_ino in visited:
+                                    continue
+                                visited.add(dev_ino)
+                            stack.append((dir_path,
+                                          in_media_root or
+                                          entry.name.lower() in self.USER_MEDIA_ROOTS))
+                            continue
+                    except OSError:
+                        continue
+
+                    stats['total_scanned'] += 1
+                    # Check the extension on the raw name first: most files
+                    # aren't media, and this rejects them without building
+                    # a path or touching the filesystem
+                    ext = _ext(entry.name)
+                    if ext not in media_exts:
+                        continue
+
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        st = None
+
+                    # Ancestor directories were vetted when pushed, so
+                    # only the file's own name and size are left to check;
+                    # inside a media root the size gate is skipped
+                    if not self._should_exclude_file(entry.name.lower(),
+                                                     None if in_media_root else st):
+                        self.found_stats.append(st)
+                        stats[ext_kind[ext]] += 1
+                        yield entry.path
+                    else:
+                        stats['excluded'] += 1
+
         except KeyboardInterrupt:
             print("Scan interrupted by user")
-        
-        return self.found_files
-    
-    def get_file_info(self, file_path: Path) -> dict:
-        """Get information about a file"""
+
+    def _scan_parallel(self, drive_path: str, progress_callback, max_workers: int,
+                       excluded_prefixes: tuple = (), allowed_exts=None):
+        """
+        Walk directories with a bounded thread pool, one job per directory
+
+        Each job lists a single directory with os.scandir, classifies its
+        files locally, then merges into the shared results under one lock,
+        so contention stays proportional to directory count, not file count.
+        """
+        media_exts = allowed_exts if allowed_exts is not None else self.MEDIA_EXTENSIONS
+        ext_kind = self.EXT_KIND
+        stats = self.scan_stats
+
+        lock = threading.Lock()
+        all_done = threading.Event()
+        outstanding = [1]  # directories submitted but not yet finished
+        last_progress = [0.0]
+        # (device, inode) of every directory submitted, shared across
+        # workers under the merge lock; breaks junction/bind-mount cycles
+        visited = set()
+        try:
+            root_st = os.lstat(drive_path)
+            visited.add((root_st.st_dev, root_st.st_ino))
+        except OSError:
+            pass
+
+        # Beyond ~32 threads the readdir/stat overlap is saturated and
+        # extra workers just contend on the merge lock
+        executor = ThreadPoolExecutor(max_workers=min(32, max_workers))
+
+        def scan_dir(root):
+            try:
+                in_media_root = self._is_media_root_path(root)
+                subdirs = []
+                files = []
+                try:
+                    with os.scandir(root) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    # lstat here for cycle detection; an
+                                    # inode of 0 means it isn't reported
+                                    dir_st = entry.stat(follow_symlinks=False)
+                                    subdirs.append(
+                                        (entry.path,
+                                         (dir_st.st_dev, dir_st.st_ino)
+                                         if dir_st.st_ino else None))
+                                else:
+                                    files.append(entry)
+                            except OSError:
+                                continue
+                except (OSError, PermissionError):
+                    return
+
+                subdirs = [d for d in subdirs
+                           if not self.should_exclude_path(d[0])]
+                if excluded_prefixes:
+                    # Separator-terminated comparison so a prefix only
+                    # matches whole path components
+                    subdirs = [d for d in subdirs
+                               if not (d[0].lower() + os.sep).startswith(excluded_prefixes)]
+
+                found = []
+                found_st = []
+                local_counts = {'photos_found': 0, 'videos_found': 0,
+                                'pdfs_found': 0, 'excluded': 0}
+                for entry in files:
+                    ext = _ext(entry.name)
+                    if ext not in media_exts:
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        st = None
+                    # Parent directories were vetted before this job was
+                    # submitted; check just the name and cached size
+                    # (no size gate inside user media trees)
+                    if not self._should_exclude_file(entry.name.lower(),
+                                                     None if in_media_root else st):
+                        found.append(entry.path)
+                        found_st.append(st)
+                        local_counts[ext_kind[ext]] += 1
+                    else:
+                        local_counts['excluded'] += 1
+
+                with lock:
+                    stats['total_scanned'] += len(files)
+                    for key, count in local_counts.items():
+                        stats[key] += count
+                    self.found_files.extend(found)
+                    self.found_stats.extend(found_st)
+                    new_subdirs = []
+                    for dir_path, dev_ino in subdirs:
+                        if dev_ino is not None:
+                            if dev_ino in visited:
+                                continue
+                            visited.add(dev_ino)
+                        new_subdirs.append(dir_path)
+                    outstanding[0] += len(new_subdirs)
+                    # Same ~20 Hz throttle as the serial walk; here it also
+                    # shortens the time spent holding the merge lock
+                    if progress_callback:
+                        now = time.monotonic()
+                        if now - last_progress[0] >= 0.05:
+                            last_progress[0] = now
+                            progress_callback(root, ScanProgress(**stats))
+                for subdir in new_subdirs:
+                    executor.submit(scan_dir, subdir)
+            finally:
+                with lock:
+                    outstanding[0] -= 1
+                    if outstanding[0] == 0:
+                        all_done.set()
+
+        executor.submit(scan_dir, drive_path)
+        all_done.wait()
+        executor.shutdown(wait=True)
+
+    def get_file_info(self, file_path: str, st=None) -> FileInfo:
+        """Get information about a file
+
+        st may carry the stat result cached during the scan, saving a
+        fresh stat syscall per file.
+        """
         try:
-            stat = file_path.stat()
-            return {
-                'path': str(file_path),
-                'name': file_path.name,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'created': datetime.fromtimestamp(stat.st_ctime),
-                'is_photo': self.is_photo(file_path),
-                'is_video': self.is_video(file_path),
-                'is_pdf': self.is_pdf(file_path)
-            }
+            if st is None and _statx.HAS_STATX:
+                # Ask the kernel for just size and timestamps
+                st = _statx.statx(file_path)
+            stat = st if st is not None else os.stat(file_path)
+            # Classify once from the extension; kind doubles as the
+            # destination subfolder name so the organizer can branch on a
+            # single lookup instead of re-testing three flags per file
+            ext = _ext(file_path)
+            return FileInfo(
+                path=file_path,
+                name=os.path.basename(file_path),
+                size=stat.st_size,
+                modified=datetime.fromtimestamp(stat.st_mtime),
+                created=datetime.fromtimestamp(stat.st_ctime),
+                kind=('Photos' if ext in self.PHOTO_EXTENSIONS else
+                      'Videos' if ext in self.VIDEO_EXTENSIONS else
+                      'PDFs' if ext in self.PDF_EXTENSIONS else 'Media')
+            )
         except (OSError, PermissionError) as e:
-            return {'error': str(e)}
+            return FileInfo(file_path, error=str(e))
 
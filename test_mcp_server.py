@@ -7,6 +7,16 @@ import subprocess
 import sys
 from pathlib import Path
 
+# orjson makes the script usable as a throughput probe against the
+# server; fall back silently since it isn't a required dependency
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 def test_mcp_server():
     """Test the MCP server with basic requests"""
@@ -43,14 +53,14 @@ def test_mcp_server():
             request["params"] = params
         
         try:
-            request_json = json.dumps(request) + "\n"
+            request_json = _dumps(request) + "\n"
             process.stdin.write(request_json)
             process.stdin.flush()
-            
+
             # Read response (blocking)
             response_line = process.stdout.readline()
             if response_line:
-                return json.loads(response_line.strip())
+                return _loads(response_line.strip())
             return None
         except Exception as e:
             print(f"Error sending request: {e}")